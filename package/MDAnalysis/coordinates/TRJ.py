@@ -132,14 +132,21 @@ AMBER ASCII trajectories are recognised by the suffix '.trj',
 import scipy.io.netcdf
 import numpy as np
 import warnings
+import itertools
 import errno
+import io
+import mmap
 import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from math import isclose
 
 import MDAnalysis
 from .timestep import Timestep
 from . import base
+from .. import units
 from ..lib import util
+from ..lib._cutil import _parse_fixed_width_floats, _scale_float32
 from ..lib.util import store_init_arguments
 logger = logging.getLogger("MDAnalysis.coordinates.AMBER")
 
@@ -185,6 +192,12 @@ class TRJReader(base.ReaderBase):
         self._n_frames = None
 
         self.trjfile = None  # have _read_next_timestep() open it properly!
+        # memory map of uncompressed files; frames are parsed straight from it
+        self._mm = None
+        self._mm_pos = 0
+        # box lengths are parsed into the first three slots; angles are
+        # always 90 degrees
+        self._dims = np.array([0., 0., 0., 90., 90., 90.], dtype=np.float32)
         self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
 
         # FORMAT(10F8.3)  (X(i), Y(i), Z(i), i=1,NATOM)
@@ -197,6 +210,9 @@ class TRJReader(base.ReaderBase):
         last_per_line = 3 * self.n_atoms % len(self.default_line_parser)
         self.last_line_parser = util.FORTRANReader("{0:d}F8.3".format(
             last_per_line))
+        # fixed column layout used to parse a whole frame at once
+        self._field_width = 8
+        self._fields_per_line = len(self.default_line_parser)
 
         # FORMAT(10F8.3)  BOX(1), BOX(2), BOX(3)
         # is this always on a separate line??
@@ -211,7 +227,10 @@ class TRJReader(base.ReaderBase):
     def _read_frame(self, frame):
         if self.trjfile is None:
             self.open_trajectory()
-        self.trjfile.seek(self._offsets[frame])
+        if self._mm is not None:
+            self._mm_pos = self._offsets[frame]
+        else:
+            self.trjfile.seek(self._offsets[frame])
         self.ts.frame = frame - 1  # gets +1'd in _read_next
         return self._read_next_timestep()
 
@@ -221,34 +240,75 @@ class TRJReader(base.ReaderBase):
         if self.trjfile is None:
             self.open_trajectory()
 
-        # Read coordinat frame:
-        # coordinates = numpy.zeros(3*self.n_atoms, dtype=np.float32)
-        _coords = []
-        for number, line in enumerate(self.trjfile):
-            try:
-                _coords.extend(self.default_line_parser.read(line))
-            except ValueError:
-                # less than 10 entries on the line:
-                _coords.extend(self.last_line_parser.read(line))
-            if number == self.lines_per_frame - 1:
-                # read all atoms that are there in this frame
-                break
-        if _coords == []:
-            # at the end of the stream (the loop has not been entered)
+        if self._mm is not None:
+            self._read_mapped_frame(ts)
+        else:
+            self._read_stream_frame(ts)
+
+        ts.frame += 1
+        return ts
+
+    def _read_mapped_frame(self, ts):
+        """Parse the frame at the current position of the memory map in place.
+        """
+        if self._mm_pos >= len(self._mm):
+            raise EOFError
+        try:
+            pos = _parse_fixed_width_floats(self._mm, ts._pos.reshape(-1),
+                                            self._field_width,
+                                            self._fields_per_line,
+                                            self._mm_pos)
+        except ValueError:
+            # only look at the span of one frame (a failed parse does not get
+            # further than that) instead of copying the rest of the file
+            line_nbytes = self._fields_per_line * self._field_width + 2
+            frame_nbytes = (self.lines_per_frame + self.periodic) * line_nbytes
+            if self._mm[self._mm_pos:self._mm_pos + frame_nbytes].strip():
+                raise
+            # only trailing whitespace is left
+            raise EOFError from None
+        if self.periodic:
+            pos = _parse_fixed_width_floats(self._mm, self._dims[:3],
+                                            self._field_width,
+                                            len(self.box_line_parser), pos)
+            ts.dimensions = self._dims
+        self._mm_pos = pos
+
+    def _read_stream_frame(self, ts):
+        """Read the next frame from the (compressed) text stream."""
+        # Read coordinate frame: the whole frame is parsed in compiled code
+        lines = list(itertools.islice(self.trjfile, self.lines_per_frame))
+        if not lines:
+            # at the end of the stream
             raise EOFError
+        if isinstance(lines[0], bytes):
+            buf = b"".join(lines)
+        else:
+            # text streams passed in by the user
+            buf = "".join(lines).encode('ascii')
+        _parse_fixed_width_floats(buf, ts._pos.reshape(-1), self._field_width,
+                                  self._fields_per_line)
 
         # Read box information
         if self.periodic:
-            line = next(self.trjfile)
-            box = self.box_line_parser.read(line)
-            ts.dimensions = box + [90., 90., 90.]  # assumed
-
-        # probably slow ... could be optimized by storing the coordinates in
-        # X,Y,Z lists or directly filling the array; the array/reshape is not
-        # good because it creates an intermediate array
-        ts._pos[:] = np.array(_coords).reshape(self.n_atoms, 3)
-        ts.frame += 1
-        return ts
+            self._read_box(next(self.trjfile), ts)
+
+    def _read_box(self, line, ts):
+        """Set the box of `ts` from the box `line` (``FORMAT(3F8.3)``)."""
+        if not isinstance(line, bytes):
+            line = line.encode('ascii')
+        _parse_fixed_width_floats(line, self._dims[:3], self._field_width,
+                                  len(self.box_line_parser))
+        ts.dimensions = self._dims  # angles assumed
+
+    def _readline(self):
+        """Read the next line from the trajectory."""
+        if self._mm is None:
+            return next(self.trjfile)
+        self._mm.seek(self._mm_pos)
+        line = self._mm.readline()
+        self._mm_pos = self._mm.tell()
+        return line
 
     def _detect_amber_box(self):
         """Detecting a box in a AMBER trajectory
@@ -285,11 +345,11 @@ class TRJReader(base.ReaderBase):
         self._read_next_timestep()
         ts = self.ts
         # TODO: what do we do with 1-frame trajectories? Try..except EOFError?
-        line = next(self.trjfile)
+        line = self._readline()
         nentries = self.default_line_parser.number_of_matches(line)
         if nentries == 3:
             self.periodic = True
-            ts.dimensions = self.box_line_parser.read(line) + [90., 90., 90.]
+            self._read_box(line, ts)
         else:
             self.periodic = False
         self.close()
@@ -312,9 +372,96 @@ class TRJReader(base.ReaderBase):
         if self.periodic:
             lpf += 1
 
-        self._offsets = offsets = []
+        mm = self._map_trajectory()
+        if mm is None:
+            # compressed files and streams cannot be memory-mapped
+            offsets = self._read_frame_offsets(lpf)
+        else:
+            with mm:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                offsets = self._fixed_frame_offsets(data, lpf)
+                if offsets is None:
+                    offsets = self._scan_frame_offsets(data, lpf)
+                del data  # the buffer must be released before closing the map
+        self._offsets = offsets
+        return len(offsets)
+
+    def _fixed_frame_offsets(self, data, lpf):
+        """Compute the byte offsets of all frames from the width of the first
+        frame, assuming that all frames have the same width in bytes.
+
+        Only the last byte of each frame is inspected to validate the
+        assumption. Returns ``None`` if the frames are not equally wide (e.g.
+        because of trailing whitespace or a truncated last frame), in which
+        case the offsets have to be found with a full scan.
+        """
+        # the header line and the first frame, allowing for CRLF line endings
+        line_nbytes = self._fields_per_line * self._field_width + 2
+        window = data[:(lpf + 1) * line_nbytes]
+        newlines = np.flatnonzero(window == ord('\n'))
+        if len(newlines) < lpf + 1:
+            return None
+        header_nbytes = newlines[0] + 1
+        frame_nbytes = newlines[lpf] - newlines[0]
+        n_frames, remainder = divmod(len(data) - header_nbytes, frame_nbytes)
+        if remainder:
+            return None
+        offsets = header_nbytes + frame_nbytes * np.arange(n_frames,
+                                                           dtype=np.int64)
+        if not np.all(data[offsets + frame_nbytes - 1] == ord('\n')):
+            return None
+        return offsets
+
+    @staticmethod
+    def _scan_frame_offsets(data, lpf, chunk=16 * 1024**2):
+        """Find the byte offsets of all frames with a vectorized newline scan
+        of the uncompressed file contents `data`.
+
+        The file is scanned in blocks of `chunk` bytes, which keeps the
+        temporary arrays small, in a pool of threads (numpy releases the GIL
+        while scanning) so that large files are scanned on several cores.
+        """
+        def scan(start):
+            block = data[start:start + chunk]
+            return np.flatnonzero(block == ord('\n')) + start
+
+        starts = range(0, len(data), chunk)
+        if len(starts) > 1:
+            with ThreadPoolExecutor() as executor:
+                newlines = np.concatenate(list(executor.map(scan, starts)))
+        else:
+            newlines = scan(0)
+        n_lines = len(newlines)
+        if len(data) and data[-1] != ord('\n'):
+            n_lines += 1  # last line without newline
+        # each frame starts after the newline that ends the header or the
+        # last line of the previous frame
+        n_frames = max(n_lines - 1, 0) // lpf
+        return newlines[:n_frames * lpf:lpf].astype(np.int64) + 1
+
+    def _map_trajectory(self):
+        """Memory-map the trajectory file read-only.
+
+        Returns ``None`` for compressed files and streams, which cannot be
+        memory-mapped.
+        """
+        if util.isstream(self.filename):
+            # note: "closing" a NamedStream rewinds it
+            return None
+        with util.openany(self.filename, 'rb') as f:
+            if not isinstance(f, io.BufferedReader):
+                return None
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # e.g. empty files or file-like objects without a descriptor
+                return None
+
+    def _read_frame_offsets(self, lpf):
+        """Find the offsets of all frames by reading the file line by line."""
+        offsets = []
         counter = 0
-        with util.openany(self.filename) as f:
+        with self._open_stream() as f:
             line = f.readline()  # ignore first line
             while line:
                 if counter % lpf == 0:
@@ -322,7 +469,7 @@ class TRJReader(base.ReaderBase):
                 line = f.readline()
                 counter += 1
         offsets.pop()  # last offset is EOF
-        return len(offsets)
+        return np.array(offsets, dtype=np.int64)
 
     @property
     def n_atoms(self):
@@ -332,10 +479,34 @@ class TRJReader(base.ReaderBase):
         self.close()
         self.open_trajectory()
 
+    def _open_stream(self):
+        """Open the trajectory as a stream of lines.
+
+        Files are opened in binary mode, so that lines can be parsed without
+        decoding them, and are read through a 1 MiB buffer so that compressed
+        files are decompressed in large blocks instead of line by line.
+        Streams are used as they are.
+        """
+        if util.isstream(self.filename):
+            return util.anyopen(self.filename)
+        return io.BufferedReader(util.anyopen(self.filename, 'rb'),
+                                 buffer_size=1024**2)
+
     def open_trajectory(self):
         """Open the trajectory for reading and load first frame."""
-        self.trjfile = util.anyopen(self.filename)
-        self.header = self.trjfile.readline()  # ignore first line
+        self._mm = self._map_trajectory()
+        if self._mm is not None:
+            # frames are parsed from the map, which also serves as the open
+            # file; the first frame starts after the header (whatever its
+            # line ending)
+            self.trjfile = self._mm
+            self.header = self._mm.readline()  # ignore first line
+            self._mm_pos = self._mm.tell()
+        else:
+            self.trjfile = self._open_stream()
+            self.header = self.trjfile.readline()  # ignore first line
+        if isinstance(self.header, bytes):
+            self.header = self.header.decode('utf-8', 'replace')
         if len(self.header.rstrip()) > 80:
             # Chimera uses this check
             raise OSError(
@@ -351,8 +522,19 @@ class TRJReader(base.ReaderBase):
         """Close trj trajectory file if it was open."""
         if self.trjfile is None:
             return
+        # this also closes the memory map, which is the open file when the
+        # trajectory is mapped
         self.trjfile.close()
         self.trjfile = None
+        self._mm = None
+
+    def __getstate__(self):
+        # memory maps cannot be pickled: the file is reopened on unpickling
+        # when the current frame is read again
+        state = self.__dict__.copy()
+        state['trjfile'] = None
+        state['_mm'] = None
+        return state
 
 
 class NCDFReader(base.ReaderBase):
@@ -390,6 +572,11 @@ class NCDFReader(base.ReaderBase):
     :class:`scipy.io.netcdf_file` prevails, i.e. ``True`` when
     *filename* is a file name, ``False`` when *filename* is a file-like object.
 
+    During sequential iteration, blocks of *prefetch* frames are read ahead
+    with a single slice per variable and the following frames are served from
+    this block. The default ``prefetch=None`` reads ahead as many frames (up to
+    64) as fit into about 16 MiB; ``prefetch=1`` switches read-ahead off.
+
     .. _AMBER NETCDF format: http://ambermd.org/netcdf/nctraj.xhtml
 
     See Also
@@ -423,6 +610,10 @@ class NCDFReader(base.ReaderBase):
        :meth:`Writer` now also sets `convert_units`, `velocities`, `forces` and
        `scale_factor` information for the :class:`NCDFWriter`.
 
+    .. versionchanged:: 2.8.0
+       Added the *prefetch* keyword to read blocks of frames ahead during
+       sequential iteration.
+
     """
 
     format = ['NCDF', 'NC']
@@ -435,8 +626,22 @@ class NCDFReader(base.ReaderBase):
 
     _Timestep = Timestep
 
+    #: units attribute that each variable must have (as stored in the file)
+    _file_units = {'time': b'picosecond',
+                   'coordinates': b'angstrom',
+                   'velocities': b'angstrom/picosecond',
+                   'forces': b'kilocalorie/mole/angstrom',
+                   'cell_lengths': b'angstrom',
+                   'cell_angles': b'degree'}
+    #: variables read ahead in blocks during sequential iteration
+    _frame_variables = ('coordinates', 'time', 'velocities', 'forces',
+                        'cell_lengths', 'cell_angles')
+    #: read-ahead budget (in bytes) when `prefetch` is not set
+    _prefetch_nbytes = 16 * 1024**2
+
     @store_init_arguments
-    def __init__(self, filename, n_atoms=None, mmap=None, **kwargs):
+    def __init__(self, filename, n_atoms=None, mmap=None, prefetch=None,
+                 **kwargs):
 
         self._mmap = mmap
 
@@ -449,9 +654,9 @@ class NCDFReader(base.ReaderBase):
 
         # AMBER NetCDF files should always have a convention
         try:
-            conventions = self.trjfile.Conventions
-            if not ('AMBER' in conventions.decode('utf-8').split(',') or
-                    'AMBER' in conventions.decode('utf-8').split()):
+            conventions = self.trjfile.Conventions.decode('utf-8')
+            if not ('AMBER' in conventions.split(',') or
+                    'AMBER' in conventions.split()):
                 errmsg = ("NCDF trajectory {0} does not conform to AMBER "
                           "specifications, "
                           "http://ambermd.org/netcdf/nctraj.xhtml "
@@ -545,7 +750,8 @@ class NCDFReader(base.ReaderBase):
         # checks for not-implemented features (other units would need to be
         # hacked into MDAnalysis.units)
         try:
-            self._verify_units(self.trjfile.variables['time'].units, 'picosecond')
+            self._verify_units(self.trjfile.variables['time'].units,
+                               self._file_units['time'])
             self.has_time = True
         except KeyError:
             self.has_time = False
@@ -556,7 +762,7 @@ class NCDFReader(base.ReaderBase):
 
 
         self._verify_units(self.trjfile.variables['coordinates'].units,
-                           'angstrom')
+                           self._file_units['coordinates'])
 
         # Check for scale_factor attributes for all data variables and
         # store this to multiply through later (Issue #2323)
@@ -582,20 +788,58 @@ class NCDFReader(base.ReaderBase):
         self.has_velocities = 'velocities' in self.trjfile.variables
         if self.has_velocities:
             self._verify_units(self.trjfile.variables['velocities'].units,
-                               'angstrom/picosecond')
+                               self._file_units['velocities'])
 
         self.has_forces = 'forces' in self.trjfile.variables
         if self.has_forces:
             self._verify_units(self.trjfile.variables['forces'].units,
-                               'kilocalorie/mole/angstrom')
+                               self._file_units['forces'])
 
         self.periodic = 'cell_lengths' in self.trjfile.variables
         if self.periodic:
             self._verify_units(self.trjfile.variables['cell_lengths'].units,
-                               'angstrom')
+                               self._file_units['cell_lengths'])
             # As of v1.0.0 only `degree` is accepted as a unit
             cell_angle_units = self.trjfile.variables['cell_angles'].units
-            self._verify_units(cell_angle_units, 'degree')
+            self._verify_units(cell_angle_units,
+                               self._file_units['cell_angles'])
+            # reused for every frame; copied into the Timestep
+            self._unitcell = np.zeros(6, dtype=np.float64)
+
+        # scale factors and unit conversions are combined into a single
+        # factor per variable so that each array is only scaled once
+        self._scales = {
+            'time': self._combined_scale('time', units.get_conversion_factor(
+                'time', self.units['time'], 'ps')),
+            'coordinates': self._combined_scale(
+                'coordinates', units.get_conversion_factor(
+                    'length', self.units['length'], 'Angstrom')),
+            'velocities': self._combined_scale(
+                'velocities', units.get_conversion_factor(
+                    'speed', self.units['velocity'], 'Angstrom/ps')),
+            'forces': self._combined_scale(
+                'forces', units.get_conversion_factor(
+                    'force', self.units['force'], 'kJ/(mol*Angstrom)')),
+            'cell_lengths': self._combined_scale(
+                'cell_lengths', units.get_conversion_factor(
+                    'length', self.units['length'], 'Angstrom')),
+            'cell_angles': self._combined_scale('cell_angles', 1.),
+        }
+        # time is a scalar, scaled with plain float arithmetic
+        self._time_scale = self._scales['time'] or 1.
+
+        self._cache_variables()
+
+        if prefetch is None:
+            frame_nbytes = sum(
+                variable.data.itemsize * int(np.prod(variable.shape[1:]))
+                for variable in self._variables.values())
+            prefetch = min(max(self._prefetch_nbytes // max(frame_nbytes, 1),
+                               1), 64)
+        self._prefetch = prefetch
+        # frames read ahead: range of frames in the block, arrays by variable
+        self._block_start = self._block_stop = 0
+        self._block = None
 
         self._current_frame = 0
 
@@ -610,10 +854,12 @@ class NCDFReader(base.ReaderBase):
 
     @staticmethod
     def _verify_units(eval_unit, expected_units):
-        if eval_unit.decode('utf-8') != expected_units:
+        # compare the raw attribute bytes; only decode for the error message
+        if eval_unit != expected_units:
             errmsg = ("NETCDFReader currently assumes that the trajectory "
                       "was written in units of {0} instead of {1}".format(
-                       eval_unit.decode('utf-8'), expected_units))
+                       eval_unit.decode('utf-8'),
+                       expected_units.decode('utf-8')))
             raise NotImplementedError(errmsg)
 
     @staticmethod
@@ -622,9 +868,12 @@ class NCDFReader(base.ReaderBase):
             n_atoms = f.dimensions['atom']
         return n_atoms
 
-    def _get_var_and_scale(self, variable, frame):
-        """Helper function to get variable at given frame from NETCDF file and
-        scale if necessary.
+    def _combined_scale(self, variable, factor):
+        """Combine the scale_factor of `variable` with the unit conversion
+        `factor` (only applied if `convert_units` is set).
+
+        Returns ``None`` if the values stored in the file can be used as they
+        are.
 
         Note
         ----
@@ -633,13 +882,49 @@ class NCDFReader(base.ReaderBase):
         """
         scale_factor = self.scale_factors[variable]
         if scale_factor is None or isclose(scale_factor, 1):
-            return self.trjfile.variables[variable][frame]
+            scale_factor = 1.
+        if self.convert_units:
+            scale_factor *= factor
+        return None if scale_factor == 1. else scale_factor
+
+    def _read_ahead(self, frame):
+        """Read a block of `prefetch` frames of all variables, starting at
+        `frame`.
+
+        The block is copied out of the file so that no references to a
+        memory-mapped file are held. The pages of the memory map are released
+        afterwards, so that iterating over a long trajectory does not keep
+        the whole file in the resident memory of the process.
+        """
+        stop = min(frame + self._prefetch, self.n_frames)
+        self._block = {name: np.array(variable[frame:stop])
+                       for name, variable in self._variables.items()}
+        self.trjfile._release_pages()
+        self._block_start = frame
+        self._block_stop = stop
+
+    def _cache_variables(self):
+        """Keep handles to the per-frame variables of the open file."""
+        variables = self.trjfile.variables
+        self._variables = {name: variables[name]
+                           for name in self._frame_variables
+                           if name in variables}
+
+    def _read_scaled(self, variable, data, out):
+        """Copy the stored `data` of `variable` into the array `out`, applying
+        the combined scale factor in the same pass.
+
+        `data` is a view of the (memory-mapped) file or of the block of frames
+        read ahead, so that the values are only copied once, straight into
+        `out`, with byte swapping and casting done on the fly.
+        """
+        scale = self._scales[variable]
+        if scale is None:
+            np.copyto(out, data)
         else:
-            return self.trjfile.variables[variable][frame] * scale_factor
+            np.multiply(data, scale, out=out)
 
     def _read_frame(self, frame):
-        ts = self.ts
-
         if self.trjfile is None:
             raise IOError("Trajectory is closed")
         if np.dtype(type(frame)) != np.dtype(int):
@@ -648,31 +933,35 @@ class NCDFReader(base.ReaderBase):
         if frame >= self.n_frames or frame < 0:
             raise IndexError("frame index must be 0 <= frame < {0}".format(
                 self.n_frames))
+        return self._fill_timestep(frame)
+
+    def _fill_timestep(self, frame):
+        """Read the valid `frame` index into the Timestep."""
+        ts = self.ts
+        if (self._prefetch > 1 and frame == self._current_frame + 1 and
+                not self._block_start <= frame < self._block_stop):
+            # sequential read beyond the current block
+            self._read_ahead(frame)
+        if self._block_start <= frame < self._block_stop:
+            data, index = self._block, frame - self._block_start
+        else:
+            data, index = self._variables, frame
         # note: self.trjfile.variables['coordinates'].shape == (frames, n_atoms, 3)
-        ts._pos[:] = self._get_var_and_scale('coordinates', frame)
+        self._read_scaled('coordinates', data['coordinates'][index], ts._pos)
         if self.has_time:
-            ts.time = self._get_var_and_scale('time', frame)
+            ts.time = float(data['time'][index]) * self._time_scale
         if self.has_velocities:
-            ts._velocities[:] = self._get_var_and_scale('velocities', frame)
+            self._read_scaled('velocities', data['velocities'][index],
+                              ts._velocities)
         if self.has_forces:
-            ts._forces[:] = self._get_var_and_scale('forces', frame)
+            self._read_scaled('forces', data['forces'][index], ts._forces)
         if self.periodic:
-            unitcell = np.zeros(6)
-            unitcell[:3] = self._get_var_and_scale('cell_lengths', frame)
-            unitcell[3:] = self._get_var_and_scale('cell_angles', frame)
+            unitcell = self._unitcell
+            self._read_scaled('cell_lengths', data['cell_lengths'][index],
+                              unitcell[:3])
+            self._read_scaled('cell_angles', data['cell_angles'][index],
+                              unitcell[3:])
             ts.dimensions = unitcell
-        if self.convert_units:
-            self.convert_pos_from_native(ts._pos)  # in-place !
-            self.convert_time_from_native(
-                ts.time)  # in-place ! (hope this works...)
-            if self.has_velocities:
-                self.convert_velocities_from_native(ts._velocities,
-                                                    inplace=True)
-            if self.has_forces:
-                self.convert_forces_from_native(ts._forces, inplace=True)
-            if self.periodic:
-                # in-place ! (only lengths)
-                self.convert_pos_from_native(ts.dimensions[:3])
         ts.frame = frame  # frame labels are 0-based
         self._current_frame = frame
         return ts
@@ -681,12 +970,41 @@ class NCDFReader(base.ReaderBase):
         self._current_frame = -1
 
     def _read_next_timestep(self, ts=None):
-        if ts is None:
-            ts = self.ts
-        try:
-            return self._read_frame(self._current_frame + 1)
-        except IndexError:
-            raise IOError from None
+        # sequential fast path: the next frame index needs no validation
+        frame = self._current_frame + 1
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        if frame >= self.n_frames:
+            raise IOError
+        return self._fill_timestep(frame)
+
+    def _read_timeseries(self, start, stop, step, atom_numbers):
+        """Read the coordinates of the atoms `atom_numbers` in the frames
+        ``range(start, stop, step)`` for :meth:`timeseries`.
+
+        The coordinates of all requested frames and atoms are gathered from
+        the file in a single read and scaled in one pass, without iterating
+        through the trajectory (the current frame is not changed). If
+        on-the-fly transformations were added to the trajectory, the frames
+        are read one by one so that the transformations are applied.
+
+
+        .. versionadded:: 2.8.0
+        """
+        if self._transformations:
+            return super(NCDFReader, self)._read_timeseries(
+                start, stop, step, atom_numbers)
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        frames = np.arange(start, stop, step)
+
+        # gather and scale in 'fac' order
+        coordinates = np.empty((len(frames), len(atom_numbers), 3),
+                               dtype=np.float32)
+        variable = self._variables['coordinates']
+        self._read_scaled('coordinates',
+                          variable[np.ix_(frames, atom_numbers)], coordinates)
+        return coordinates
 
     def _get_dt(self):
         """Gets dt based on the time difference between the first and second
@@ -709,10 +1027,29 @@ class NCDFReader(base.ReaderBase):
                   before the file can be closed.
 
         """
+        self._block = None
+        self._block_start = self._block_stop = 0
+        # the cached variables refer to the memory-mapped data, too
+        self._variables = {}
         if self.trjfile is not None:
             self.trjfile.close()
             self.trjfile = None
 
+    def __getstate__(self):
+        # frames that were read ahead are not worth pickling and variable
+        # handles belong to the open file
+        state = self.__dict__.copy()
+        state['_block'] = None
+        state['_block_start'] = state['_block_stop'] = 0
+        state['_variables'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        if self.trjfile is not None:
+            self._cache_variables()
+        super(NCDFReader, self).__setstate__(state)
+
     def Writer(self, filename, **kwargs):
         """Returns a NCDFWriter for `filename` with the same parameters as this NCDF.
 
@@ -759,6 +1096,31 @@ class NCDFReader(base.ReaderBase):
         return NCDFWriter(filename, n_atoms, **kwargs)
 
 
+# labels of the spatial, cell_spatial and cell_angular variables (read-only
+# views of the bytes, shared by all writers)
+_SPATIAL_CHARS = np.frombuffer(b'xyz', dtype='S1')
+_CELL_SPATIAL_CHARS = np.frombuffer(b'abc', dtype='S1')
+_CELL_ANGULAR_CHARS = np.frombuffer(b'alphabeta gamma',
+                                    dtype='S1').reshape(3, 5)
+
+# cell written for frames without a box (read-only, shared by all writers)
+_NO_CELL = np.zeros(3)
+_NO_CELL.setflags(write=False)
+
+
+def _cell_lengths(ts):
+    """Unit cell lengths of `ts`, zero if it has no box."""
+    # a Timestep without a box has zero lengths; reading the unit cell
+    # directly avoids the temporaries of the Timestep.dimensions check
+    return ts._unitcell[:3]
+
+
+def _cell_angles(ts):
+    """Unit cell angles of `ts`, zero if it has no box."""
+    unitcell = ts._unitcell
+    return unitcell[3:] if unitcell[:3].any() else _NO_CELL
+
+
 class NCDFWriter(base.WriterBase):
     """Writer for `AMBER NETCDF format`_ (version 1.0).
 
@@ -807,6 +1169,48 @@ class NCDFWriter(base.WriterBase):
         Scale factor for velocities [20.455]
     scale_forces : float (optional)
         Scale factor for forces [``None``]
+    buffer_frames : int (optional)
+        Number of frames that are collected in memory and then written to the
+        file (and synced to disk) at once. The default ``None`` buffers as
+        many frames (up to 100) as fit into about 16 MiB; ``1`` writes and
+        syncs every frame immediately. [``None``]
+    nc_format : str (optional)
+        File format, ``'NETCDF3_64BIT'`` (64-bit offset netCDF-3, as required
+        by the AMBER convention) or ``'NETCDF4_CLASSIC'`` (netCDF-4/HDF5 file
+        with the classic data model, which can be chunked and compressed).
+        ``'NETCDF4_CLASSIC'`` requires :mod:`netCDF4`, and the files cannot be
+        read by :class:`NCDFReader` (which uses :mod:`scipy.io.netcdf`).
+        [``'NETCDF3_64BIT'``]
+    async_io : bool (optional)
+        ``True``: full buffers are written to the file in a background thread
+        while the next frames are collected in a second set of buffers. Only
+        used with :mod:`netCDF4`; errors while writing are raised by the next
+        write or by :meth:`close`. [``False``]
+    constant_box : bool (optional)
+        ``True``: the unit cell of the first frame is written for all frames,
+        e.g. for a trajectory at constant volume, so that the unit cell is not
+        read and converted for every frame. [``False``]
+    frames_per_chunk : int (optional)
+        Number of frames in one chunk of the per-frame variables of netCDF-4
+        (HDF5) files. The default ``None`` chooses about 20 MiB of coordinates
+        per chunk (at most 1024 frames). The netCDF-3 files that are written
+        for the AMBER convention are not chunked and ignore this value.
+        [``None``]
+    chunk_cache_bytes : int (optional)
+        Size of the HDF5 chunk cache of each per-frame variable of netCDF-4
+        files. The default ``None`` holds four chunks of coordinates but at
+        least 32 MiB, so that a partially written chunk stays in memory until
+        it is full. [``None``]
+    compression : str (optional)
+        ``'zlib'`` compresses the coordinates, velocities and forces of
+        netCDF-4 files with zlib; ``None`` writes them uncompressed. netCDF-3
+        files cannot be compressed. [``None``]
+    complevel : int (optional)
+        zlib compression level between 1 and 9 [4]
+    shuffle : bool (optional)
+        Apply the HDF5 shuffle filter before compressing, which groups the
+        bytes of the floating point values and makes them compress better
+        [``True``]
 
 
     Note
@@ -818,6 +1222,9 @@ class NCDFWriter(base.WriterBase):
     requires the compiled netcdf library to be installed) is fast at writing
     but slow at reading. Therefore, we try to use :mod:`netCDF4` for writing if
     available but otherwise fall back to the slower :mod:`scipy.io.netcdf`.
+    Because :mod:`scipy.io.netcdf` rewrites the whole file whenever it is
+    synced, the fallback keeps the trajectory in memory and only writes the
+    file when the writer is closed.
 
     **AMBER users** might have a hard time getting netCDF4 to work with a
     conda-based installation (as discussed in `Issue #506`_) because of the way
@@ -885,6 +1292,15 @@ class NCDFWriter(base.WriterBase):
        Writing of ``scale_factor`` values has now been implemented. By default
        only velocities write a scale_factor of 20.455 (echoing the behaviour
        seen from AMBER).
+    .. versionchanged:: 2.8.0
+       Frames are buffered in memory and written in blocks of `buffer_frames`
+       frames instead of syncing the file after every frame.
+       Added the *nc_format* keyword to write netCDF-4 files, which are
+       chunked with *frames_per_chunk* and *chunk_cache_bytes* and can be
+       compressed with *compression*, *complevel* and *shuffle*.
+       Added the *constant_box* keyword to write the unit cell of the first
+       frame for all frames and the *async_io* keyword to write full buffers
+       in a background thread.
 
     """
 
@@ -895,12 +1311,30 @@ class NCDFWriter(base.WriterBase):
              'length': 'Angstrom',
              'velocity': 'Angstrom/ps',
              'force': 'kcal/(mol*Angstrom)'}
+    # functions that get the data of a variable from a Timestep
+    _getters = {'coordinates': operator.attrgetter('_pos'),
+                'time': operator.attrgetter('time'),
+                'cell_lengths': _cell_lengths,
+                'cell_angles': _cell_angles,
+                'velocities': operator.attrgetter('_velocities'),
+                'forces': operator.attrgetter('_forces')}
+    # parts of [A, B, C, alpha, beta, gamma] stored in the cell variables
+    _cell_parts = {'cell_lengths': slice(None, 3),
+                   'cell_angles': slice(3, None)}
+    # functions that get the Timestep of an AtomGroup or a Universe
+    _ts_getters = (operator.attrgetter('ts'),
+                   operator.attrgetter('trajectory.ts'))
+    # the one that worked for the last frame is tried first
+    _get_ts = _ts_getters[0]
 
     def __init__(self, filename, n_atoms, remarks=None, convert_units=True,
                  velocities=False, forces=False, scale_time=None,
                  scale_cell_lengths=None, scale_cell_angles=None,
                  scale_coordinates=None, scale_velocities=None,
-                 scale_forces=None, **kwargs):
+                 scale_forces=None, buffer_frames=None, constant_box=False,
+                 frames_per_chunk=None, chunk_cache_bytes=None,
+                 compression=None, complevel=4, shuffle=True,
+                 nc_format='NETCDF3_64BIT', async_io=False, **kwargs):
         self.filename = filename
         if n_atoms == 0:
             raise ValueError("NCDFWriter: no atoms in output trajectory")
@@ -929,9 +1363,100 @@ class NCDFWriter(base.WriterBase):
                     not isinstance(value, (float, np.floating))):
                 errmsg = f"scale_factor {value} is not a float"
                 raise TypeError(errmsg)
+        # unit conversion and scale factor combined into a single factor that
+        # the data are multiplied with (None if written unchanged)
+        self._scales = {
+            'time': self._combined_scale('time', units.get_conversion_factor(
+                'time', 'ps', self.units['time'])),
+            'coordinates': self._combined_scale(
+                'coordinates', units.get_conversion_factor(
+                    'length', 'Angstrom', self.units['length'])),
+            'velocities': self._combined_scale(
+                'velocities', units.get_conversion_factor(
+                    'speed', 'Angstrom/ps', self.units['velocity'])),
+            'forces': self._combined_scale(
+                'forces', units.get_conversion_factor(
+                    'force', 'kJ/(mol*Angstrom)', self.units['force'])),
+            'cell_lengths': self._combined_scale(
+                'cell_lengths', units.get_conversion_factor(
+                    'length', 'Angstrom', self.units['length'])),
+            'cell_angles': self._combined_scale('cell_angles', 1.),
+        }
+
+        if buffer_frames is not None and (
+                not isinstance(buffer_frames, (int, np.integer)) or
+                buffer_frames < 1):
+            errmsg = f"buffer_frames {buffer_frames} is not None or an int >= 1"
+            raise ValueError(errmsg)
+        self.buffer_frames = buffer_frames
+        self.constant_box = constant_box
+        # frames collected in memory, by variable, before they are written
+        self._buffers = {}
+        self._buf_fill = 0
+        self._sync = True
+        self.async_io = async_io
+        # single thread that writes buffers in the background, and the
+        # write in progress
+        self._executor = None
+        self._pending = None
+
+        if frames_per_chunk is not None and (
+                not isinstance(frames_per_chunk, (int, np.integer)) or
+                frames_per_chunk < 1):
+            errmsg = (f"frames_per_chunk {frames_per_chunk} is not None or "
+                      "an int >= 1")
+            raise ValueError(errmsg)
+        if frames_per_chunk is None:
+            # about 20 MiB of coordinates per chunk
+            frames_per_chunk = max(1, min(1024, (20 * 1024**2) //
+                                          (self.n_atoms * 12)))
+        self.frames_per_chunk = frames_per_chunk
+        if chunk_cache_bytes is None:
+            chunk_cache_bytes = max(32 * 1024**2,
+                                    4 * frames_per_chunk * self.n_atoms * 12)
+        self.chunk_cache_bytes = chunk_cache_bytes
+
+        if nc_format not in ('NETCDF3_64BIT', 'NETCDF4_CLASSIC'):
+            errmsg = (f"nc_format {nc_format} is not 'NETCDF3_64BIT' or "
+                      "'NETCDF4_CLASSIC'")
+            raise ValueError(errmsg)
+        if nc_format != 'NETCDF3_64BIT' and not netCDF4:
+            errmsg = f"nc_format {nc_format} requires the netCDF4 module"
+            raise ValueError(errmsg)
+        self.nc_format = nc_format
+
+        if compression not in ('zlib', None):
+            errmsg = f"compression {compression} is not 'zlib' or None"
+            raise ValueError(errmsg)
+        if (not isinstance(complevel, (int, np.integer)) or
+                not 1 <= complevel <= 9):
+            errmsg = f"complevel {complevel} is not an int between 1 and 9"
+            raise ValueError(errmsg)
+        self.compression = compression
+        self.complevel = complevel
+        self.shuffle = shuffle
 
         self.curr_frame = 0
 
+    def _combined_scale(self, variable, factor):
+        """Combine the reciprocal scale_factor of `variable` with the unit
+        conversion `factor` (only applied if `convert_units` is set).
+
+        Returns ``None`` if the data can be written as they are.
+
+        Note
+        ----
+        If scale_factor is 1.0 within numerical precision then we don't apply
+        the scaling.
+        """
+        scale = 1.
+        scale_factor = self.scale_factors[variable]
+        if scale_factor is not None and not isclose(scale_factor, 1):
+            scale /= scale_factor
+        if self.convert_units:
+            scale *= factor
+        return None if scale == 1. else scale
+
     def _init_netcdf(self, periodic=True):
         """Initialize netcdf AMBER 1.0 trajectory.
 
@@ -958,22 +1483,32 @@ class NCDFWriter(base.WriterBase):
 
         if netCDF4:
             ncfile = netCDF4.Dataset(self.filename, 'w',
-                                     format='NETCDF3_64BIT')
+                                     format=self.nc_format)
+            # every frame of every variable is written exactly once, so the
+            # library does not need to pre-fill new records (or chunks)
+            ncfile.set_fill_off()
+            self._sync = True
+            if self.async_io:
+                self._executor = ThreadPoolExecutor(max_workers=1)
         else:
             ncfile = scipy.io.netcdf_file(self.filename,
                                           mode='w', version=2,
                                           maskandscale=False)
+            # scipy rewrites the whole file on every sync, so only write it
+            # once when the writer is closed
+            self._sync = False
             wmsg = ("Could not find netCDF4 module. Falling back to MUCH "
-                    "slower scipy.io.netcdf implementation for writing.")
+                    "slower scipy.io.netcdf implementation for writing. The "
+                    "file is only complete after the writer is closed.")
             logger.warning(wmsg)
             warnings.warn(wmsg)
 
         # Set global attributes.
-        setattr(ncfile, 'program', 'MDAnalysis.coordinates.TRJ.NCDFWriter')
-        setattr(ncfile, 'programVersion', MDAnalysis.__version__)
-        setattr(ncfile, 'Conventions', 'AMBER')
-        setattr(ncfile, 'ConventionVersion', '1.0')
-        setattr(ncfile, 'application', 'MDAnalysis')
+        ncfile.program = 'MDAnalysis.coordinates.TRJ.NCDFWriter'
+        ncfile.programVersion = MDAnalysis.__version__
+        ncfile.Conventions = 'AMBER'
+        ncfile.ConventionVersion = '1.0'
+        ncfile.application = 'MDAnalysis'
 
         # Create dimensions
         ncfile.createDimension('frame',
@@ -987,53 +1522,63 @@ class NCDFWriter(base.WriterBase):
 
         # Create variables.
         coords = ncfile.createVariable('coordinates', 'f4',
-                                       ('frame', 'atom', 'spatial'))
-        setattr(coords, 'units', 'angstrom')
+                                       ('frame', 'atom', 'spatial'),
+                                       **self._storage(ncfile, self.n_atoms,
+                                                       3, compress=True))
+        coords.units = 'angstrom'
         if self.scale_factors['coordinates']:
             coords.scale_factor = self.scale_factors['coordinates']
 
         spatial = ncfile.createVariable('spatial', 'c', ('spatial', ))
-        spatial[:] = np.asarray(list('xyz'))
+        spatial[:] = _SPATIAL_CHARS
 
-        time = ncfile.createVariable('time', 'f4', ('frame',))
-        setattr(time, 'units', 'picosecond')
+        time = ncfile.createVariable('time', 'f4', ('frame',),
+                                     **self._storage(ncfile))
+        time.units = 'picosecond'
         if self.scale_factors['time']:
             time.scale_factor = self.scale_factors['time']
 
         self.periodic = periodic
         if self.periodic:
             cell_lengths = ncfile.createVariable('cell_lengths', 'f8',
-                                                 ('frame', 'cell_spatial'))
-            setattr(cell_lengths, 'units', 'angstrom')
+                                                 ('frame', 'cell_spatial'),
+                                                 **self._storage(ncfile, 3))
+            cell_lengths.units = 'angstrom'
             if self.scale_factors['cell_lengths']:
                 cell_lengths.scale_factor = self.scale_factors['cell_lengths']
 
             cell_spatial = ncfile.createVariable('cell_spatial', 'c',
                                                  ('cell_spatial', ))
-            cell_spatial[:] = np.asarray(list('abc'))
+            cell_spatial[:] = _CELL_SPATIAL_CHARS
 
             cell_angles = ncfile.createVariable('cell_angles', 'f8',
-                                                ('frame', 'cell_angular'))
-            setattr(cell_angles, 'units', 'degree')
+                                                ('frame', 'cell_angular'),
+                                                **self._storage(ncfile, 3))
+            cell_angles.units = 'degree'
             if self.scale_factors['cell_angles']:
                 cell_angles.scale_factor = self.scale_factors['cell_angles']
 
             cell_angular = ncfile.createVariable('cell_angular', 'c',
                                                  ('cell_angular', 'label'))
-            cell_angular[:] = np.asarray([list('alpha'), list('beta '), list(
-                'gamma')])
+            cell_angular[:] = _CELL_ANGULAR_CHARS
 
         # These properties are optional, and are specified on Writer creation
         if self.has_velocities:
             velocs = ncfile.createVariable('velocities', 'f4',
-                                           ('frame', 'atom', 'spatial'))
-            setattr(velocs, 'units', 'angstrom/picosecond')
+                                           ('frame', 'atom', 'spatial'),
+                                           **self._storage(ncfile,
+                                                           self.n_atoms, 3,
+                                                           compress=True))
+            velocs.units = 'angstrom/picosecond'
             if self.scale_factors['velocities']:
                 velocs.scale_factor = self.scale_factors['velocities']
         if self.has_forces:
             forces = ncfile.createVariable('forces', 'f4',
-                                           ('frame', 'atom', 'spatial'))
-            setattr(forces, 'units', 'kilocalorie/mole/angstrom')
+                                           ('frame', 'atom', 'spatial'),
+                                           **self._storage(ncfile,
+                                                           self.n_atoms, 3,
+                                                           compress=True))
+            forces.units = 'kilocalorie/mole/angstrom'
             if self.scale_factors['forces']:
                 forces.scale_factor = self.scale_factors['forces']
 
@@ -1042,9 +1587,95 @@ class NCDFWriter(base.WriterBase):
         if netCDF4:
             ncfile.set_auto_maskandscale(False)
 
+        if self._is_chunked(ncfile):
+            # keep partially written chunks in the cache instead of reading
+            # them back from disk for every block of frames that is appended
+            for var in ncfile.variables.values():
+                if var.dimensions[0] == 'frame':
+                    var.set_var_chunk_cache(self.chunk_cache_bytes, 521, 0.75)
+
         ncfile.sync()
         self._first_frame = False
         self.trjfile = ncfile
+        self._init_buffers()
+
+    @staticmethod
+    def _is_chunked(ncfile):
+        """Test if the variables of `ncfile` are stored in chunks.
+
+        Only netCDF-4 (HDF5) files are chunked; the records of netCDF-3 files
+        are always stored contiguously.
+        """
+        return bool(netCDF4) and ncfile.data_model.startswith('NETCDF4')
+
+    def _storage(self, ncfile, *shape, compress=False):
+        """Keywords for :meth:`createVariable` that chunk a per-frame
+        variable with `shape` per frame along the ``frame`` dimension and,
+        with `compress`, compress it as selected with `compression`.
+        """
+        if not self._is_chunked(ncfile):
+            return {}
+        options = {'chunksizes': (self.frames_per_chunk,) + shape}
+        if compress and self.compression == 'zlib':
+            options.update(zlib=True, complevel=self.complevel,
+                           shuffle=self.shuffle)
+        return options
+
+    def _init_buffers(self):
+        """Allocate the buffers that collect frames before they are written
+        and fix the variables that are written for each frame.
+        """
+        variables = ['coordinates', 'time']
+        if self.periodic:
+            variables.extend(['cell_lengths', 'cell_angles'])
+        if self.has_velocities:
+            variables.append('velocities')
+        if self.has_forces:
+            variables.append('forces')
+        shapes = {name: self.trjfile.variables[name].shape[1:]
+                  for name in variables}
+        # the cell variables are written in double precision
+        dtypes = {name: np.float64 if name.startswith('cell') else np.float32
+                  for name in variables}
+
+        if self.buffer_frames is None:
+            frame_nbytes = sum(np.dtype(dtypes[name]).itemsize *
+                               int(np.prod(shapes[name]))
+                               for name in variables)
+            self.buffer_frames = min(max((16 * 1024**2) // frame_nbytes, 1),
+                                     100)
+        # with asynchronous writes, frames are staged in one set of buffers
+        # while the other one is written
+        self._buffer_sets = [
+            {name: np.empty((self.buffer_frames,) + shapes[name],
+                            dtype=dtypes[name])
+             for name in variables}
+            for _ in range(2 if self._executor is not None else 1)]
+        self._buf_fill = 0
+        self._frame_variables = variables
+        # with a constant box the cell buffers are filled once, with the
+        # first frame, and then left alone
+        self._constant = [name for name in variables
+                          if self.constant_box and name.startswith('cell')]
+        self._constant_staging = [
+            (self._cell_parts[name], buffers[name], self._scales[name])
+            for buffers in self._buffer_sets for name in self._constant]
+        self._use_buffers(self._buffer_sets[0])
+
+    def _use_buffers(self, buffers):
+        """Stage the following frames in the set of `buffers`."""
+        self._buffers = buffers
+        # variables written for each frame, with the function that gets their
+        # data from a Timestep, their buffer and their combined scale; fixed
+        # once the file is set up so that writing a frame neither tests the
+        # options nor looks up the scale factors again
+        self._staging = [(self._getters[name], buffers[name],
+                          self._scales[name])
+                         for name in self._frame_variables
+                         if name not in self._constant]
+        # file variables that the buffers are flushed to
+        self._variables = [(self.trjfile.variables[name], buffers[name])
+                           for name in self._frame_variables]
 
     def is_periodic(self, ts):
         """Test if timestep ``ts`` contains a periodic box.
@@ -1078,13 +1709,17 @@ class NCDFWriter(base.WriterBase):
            Use AtomGroup or Universe as an input instead.
         """
         try:
-            # Atomgroup?
-            ts = ag.ts
+            ts = self._get_ts(ag)
         except AttributeError:
-            try:
-                # Universe?
-                ts = ag.trajectory.ts
-            except AttributeError:
+            # different kind of input than before: AtomGroup or Universe?
+            for get_ts in self._ts_getters:
+                try:
+                    ts = get_ts(ag)
+                except AttributeError:
+                    continue
+                self._get_ts = get_ts
+                break
+            else:
                 errmsg = "Input obj is neither an AtomGroup or Universe"
                 raise TypeError(errmsg) from None
 
@@ -1095,22 +1730,173 @@ class NCDFWriter(base.WriterBase):
         if self.trjfile is None:
             # first time step: analyze data and open trajectory accordingly
             self._init_netcdf(periodic=self.is_periodic(ts))
+            self._fill_constant_cell(ts.dimensions)
 
         return self._write_next_timestep(ts)
 
-    def _set_frame_var_and_scale(self, varname, data):
-        """Helper function to set variables and scale them if necessary.
+    def _fill_constant_cell(self, unitcell):
+        """Fill the cell buffers of a constant box with `unitcell`
+        (``[A, B, C, alpha, beta, gamma]`` or ``None`` for no box)."""
+        if unitcell is None:
+            unitcell = np.zeros(6)
+        for part, buf, scale in self._constant_staging:
+            # every frame in the buffer holds the cell of the first frame
+            if scale is None:
+                buf[...] = unitcell[part]
+            else:
+                np.multiply(unitcell[part], scale, out=buf)
+
+    def write_frames(self, positions, times, boxes=None, velocities=None,
+                     forces=None):
+        """Write a block of frames from arrays.
+
+        All frames are converted and scaled at once and then written with a
+        single write per variable, without creating a :class:`Timestep` for
+        each frame. Frames written with :meth:`write` before are written to
+        the file first, so that frames can be written with both methods.
 
-        Note
-        ----
-        If scale_factor is numerically close to 1.0, the variable data is not
-        scaled.
+        Parameters
+        ----------
+        positions : numpy.ndarray
+            coordinates (in Å) of shape ``(n_frames, n_atoms, 3)``
+        times : numpy.ndarray
+            times (in ps) of shape ``(n_frames,)``
+        boxes : numpy.ndarray (optional)
+            unit cells ``[A, B, C, alpha, beta, gamma]`` of shape
+            ``(n_frames, 6)``; if this is the first block of frames, the file
+            is only periodic if `boxes` is given [``None``]
+        velocities : numpy.ndarray (optional)
+            velocities (in Å/ps) of shape ``(n_frames, n_atoms, 3)``, required
+            if the writer writes velocities [``None``]
+        forces : numpy.ndarray (optional)
+            forces (in kJ/(mol·Å)) of shape ``(n_frames, n_atoms, 3)``,
+            required if the writer writes forces [``None``]
+
+        Raises
+        ------
+        ValueError
+            if the arrays have the wrong shape, velocities or forces are
+            missing or given although they are not written, or `boxes` are
+            given for a trajectory that is not periodic
+
+
+        .. versionadded:: 2.8.0
+        """
+        positions = np.asarray(positions)
+        n_frames = len(positions)
+        data = {'coordinates': positions, 'time': np.asarray(times)}
+        shapes = {'coordinates': (n_frames, self.n_atoms, 3),
+                  'time': (n_frames,)}
+        for name, values, shape in (
+                ('cell', boxes, (n_frames, 6)),
+                ('velocities', velocities, (n_frames, self.n_atoms, 3)),
+                ('forces', forces, (n_frames, self.n_atoms, 3))):
+            if values is not None:
+                data[name] = np.asarray(values)
+                shapes[name] = shape
+        for name, shape in shapes.items():
+            if data[name].shape != shape:
+                raise ValueError(
+                    "NCDFWriter: {0} of shape {1} instead of {2}".format(
+                        name, data[name].shape, shape))
+        for name, wanted in (('velocities', self.has_velocities),
+                             ('forces', self.has_forces)):
+            if wanted and name not in data:
+                raise ValueError(
+                    "NCDFWriter: {0} are written but not given".format(name))
+            if not wanted and name in data:
+                raise ValueError(
+                    "NCDFWriter: {0} given but not written, create the "
+                    "writer with {0}=True".format(name))
+
+        if self.trjfile is None:
+            self._init_netcdf(periodic=boxes is not None)
+            self._fill_constant_cell(data['cell'][0] if n_frames and
+                                     boxes is not None else None)
+        elif boxes is not None and not self.periodic:
+            raise ValueError(
+                "NCDFWriter: boxes given but the trajectory is not periodic")
+        if 'cell' not in data:
+            data['cell'] = np.zeros((n_frames, 6))
+
+        # frames written before come first in the file
+        self._flush_buffers()
+        self._wait_for_write()
+
+        start, stop = self.curr_frame, self.curr_frame + n_frames
+        for name in self._frame_variables:
+            buf = self._buffers[name]
+            if name in self._constant:
+                values = np.broadcast_to(buf[0], (n_frames,) + buf.shape[1:])
+            else:
+                if name in self._cell_parts:
+                    source = data['cell'][:, self._cell_parts[name]]
+                else:
+                    source = data[name]
+                values = np.empty(source.shape, dtype=buf.dtype)
+                scale = self._scales[name]
+                if scale is None:
+                    values[...] = source
+                else:
+                    np.multiply(source, scale, out=values)
+            self.trjfile.variables[name][start:stop] = values
+        self.curr_frame = stop
+        if self._sync:
+            self.trjfile.sync()
+
+    def _stage_frame_var_and_scale(self, data, buf, scale):
+        """Helper function to put variables into the frame buffer `buf`,
+        converting units and scaling them with `scale` if it is not ``None``.
+
+        The data are converted, scaled and cast to the type of the file
+        variable in a single pass, straight into the buffer, so that no
+        temporary arrays are created and `data` itself is not changed.
+        Per-atom arrays are scaled by a compiled kernel that computes in
+        double precision.
+        """
+        # one-frame slice so that scalars (time) also get a writable view
+        out = buf[self._buf_fill:self._buf_fill + 1]
+        if scale is None:
+            out[...] = data
+        elif out.ndim == 3:
+            _scale_float32(data, scale, out[0])
+        else:
+            np.multiply(data, scale, out=out)
+
+    def _flush_buffers(self):
+        """Write the buffered frames to the file and sync it to disk.
+
+        Files written with :mod:`scipy.io.netcdf` are not synced because
+        that rewrites the whole file; they are written on :meth:`close`.
         """
-        sfactor = self.scale_factors[varname]
-        if sfactor is None or isclose(sfactor, 1):
-            self.trjfile.variables[varname][self.curr_frame] = data
+        if not self._buf_fill:
+            return
+        start = self.curr_frame - self._buf_fill
+        if self._executor is None:
+            self._write_buffers(self._variables, start, self._buf_fill)
         else:
-            self.trjfile.variables[varname][self.curr_frame] = data / sfactor
+            # the other set of buffers can only be reused once it is written
+            self._wait_for_write()
+            self._pending = self._executor.submit(
+                self._write_buffers, self._variables, start, self._buf_fill)
+            self._use_buffers(self._buffer_sets[
+                self._buffer_sets[0] is self._buffers])
+        self._buf_fill = 0
+
+    def _write_buffers(self, variables, start, n_frames):
+        """Write the first `n_frames` frames of the buffers in `variables`
+        to the file, starting at frame `start`."""
+        for variable, buf in variables:
+            variable[start:start + n_frames] = buf[:n_frames]
+        if self._sync:
+            self.trjfile.sync()
+
+    def _wait_for_write(self):
+        """Wait for an asynchronous write of buffers to finish and raise
+        any error that occurred while writing."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
 
     def _write_next_timestep(self, ts):
         """Write coordinates and unitcell information to NCDF file.
@@ -1129,61 +1915,33 @@ class NCDFWriter(base.WriterBase):
 
         .. versionchanged:: 2.0.0
            Can now write scale_factors, and scale variables accordingly.
+        .. versionchanged:: 2.8.0
+           Unit conversion and scaling are done in a single pass into the
+           frame buffer instead of on temporary copies.
         """
-        pos = ts._pos
-        time = ts.time
-        unitcell = ts.dimensions
-
-        if self.convert_units:
-            # make a copy of the scaled positions so that the in-memory
-            # timestep is not changed (would have lead to wrong results if
-            # analysed *after* writing a time step to disk). The new
-            # implementation could lead to memory problems and/or slow-down for
-            # very big systems because we temporarily create a new array pos
-            # for each frame written
-            pos = self.convert_pos_to_native(pos, inplace=False)
-            time = self.convert_time_to_native(time, inplace=False)
-            unitcell = self.convert_dimensions_to_unitcell(ts)
-
-        # write step
-        # coordinates
-        self._set_frame_var_and_scale('coordinates', pos)
-
-        # time
-        self._set_frame_var_and_scale('time', time)
-
-        # unitcell
-        if self.periodic:
-            # cell lengths
-            self._set_frame_var_and_scale('cell_lengths', unitcell[:3])
-
-            self._set_frame_var_and_scale('cell_angles', unitcell[3:])
-
-        # velocities
-        if self.has_velocities:
-            velocities = ts._velocities
-            if self.convert_units:
-                velocities = self.convert_velocities_to_native(
-                    velocities, inplace=False)
-
-            self._set_frame_var_and_scale('velocities', velocities)
-
-        # forces
-        if self.has_forces:
-            forces = ts._forces
-            if self.convert_units:
-                forces = self.convert_forces_to_native(
-                    forces, inplace=False)
-
-            self._set_frame_var_and_scale('forces', forces)
-
-        self.trjfile.sync()
+        # write step (into the frame buffer); the data are converted to
+        # native units on the fly so that the in-memory timestep is not
+        # changed. Coordinates, time and, depending on the options chosen
+        # with the first frame, unitcell, velocities and forces.
+        for getter, buf, scale in self._staging:
+            self._stage_frame_var_and_scale(getter(ts), buf, scale)
+
+        self._buf_fill += 1
         self.curr_frame += 1
+        if self._buf_fill == self.buffer_frames:
+            self._flush_buffers()
 
     def close(self):
         if self.trjfile is not None:
-            self.trjfile.close()
-            self.trjfile = None
+            try:
+                self._flush_buffers()
+                self._wait_for_write()
+            finally:
+                if self._executor is not None:
+                    self._executor.shutdown()
+                    self._executor = None
+                self.trjfile.close()
+                self.trjfile = None
 
 
 class NCDFPicklable(scipy.io.netcdf_file):
@@ -1233,6 +1991,12 @@ class NCDFPicklable(scipy.io.netcdf_file):
         with NCDFPicklable(NCDF) as f:
             print(f.variables['coordinates'].data)
 
+    When the file is memory-mapped (the default for a file name),
+    ``variables[...].data`` is a view of the file in its big-endian byte
+    order and accessing it copies nothing. Byte swapping only happens when
+    values are copied into native arrays, e.g. with :func:`numpy.copyto`,
+    which is how :class:`NCDFReader` reads each frame in a single pass.
+
     See Also
     ---------
     :class:`MDAnalysis.lib.picklable_file_io.FileIOPicklable`
@@ -1247,10 +2011,28 @@ class NCDFPicklable(scipy.io.netcdf_file):
 
     .. _`scipy netcdf API documentation`: https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.netcdf_file.html
     """
+    def _release_pages(self):
+        """Drop the pages of the memory-mapped file from the resident memory
+        of this process.
+
+        The data stay valid: pages that are accessed again are reloaded from
+        the file (usually from the page cache of the operating system). Does
+        nothing if the file is not memory-mapped or the platform does not
+        support :meth:`mmap.mmap.madvise`.
+        """
+        mm = getattr(self, '_mm', None)
+        if mm is not None and hasattr(mmap, 'MADV_DONTNEED'):
+            mm.madvise(mmap.MADV_DONTNEED)
+
     def __getstate__(self):
         return (self.filename, self.use_mmap, self.version_byte,
                 self.maskandscale)
 
     def __setstate__(self, args):
+        # The header is parsed again instead of being restored from the
+        # pickle: for AMBER files it is a few hundred bytes describing about a
+        # dozen variables, and the variables are views into the memory map
+        # whose layout only scipy knows, so re-parsing is both cheap and the
+        # only way to pick up a file that changed since it was pickled.
         self.__init__(args[0], mmap=args[1], version=args[2],
                       maskandscale=args[3])
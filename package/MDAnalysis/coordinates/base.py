@@ -1029,34 +1029,51 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
 
 
         .. versionadded:: 2.4.0
+        .. versionchanged:: 2.8.0
+           Readers can provide a faster way to read the coordinates by
+           overriding :meth:`_read_timeseries`.
         """
+        atom_numbers = self._timeseries_atom_numbers(asel, atomgroup)
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        coordinates = self._read_timeseries(start, stop, step, atom_numbers)
+        return self._timeseries_order(coordinates, order)
+
+    def _timeseries_atom_numbers(self, asel, atomgroup):
+        """Indices of the atoms selected with the `asel` or `atomgroup`
+        arguments of :meth:`timeseries` (all atoms if neither is given)."""
         if asel is not None:
             warnings.warn(
-                "asel argument to timeseries will be renamed to"
+                "asel argument to timeseries will be renamed to "
                 "'atomgroup' in 3.0, see #3911",
                 category=DeprecationWarning)
             if atomgroup:
                 raise ValueError("Cannot provide both asel and atomgroup kwargs")
             atomgroup = asel
-        start, stop, step = self.check_slice_indices(start, stop, step)
-        nframes = len(range(start, stop, step))
 
         if atomgroup is not None:
             if len(atomgroup) == 0:
                 raise ValueError(
                     "Timeseries requires at least one atom to analyze")
-            atom_numbers = atomgroup.indices
-            natoms = len(atom_numbers)
-        else:
-            natoms = self.n_atoms
-            atom_numbers = np.arange(natoms)
+            return atomgroup.indices
+        return np.arange(self.n_atoms)
 
-        # allocate output array in 'fac' order
-        coordinates = np.empty((nframes, natoms, 3), dtype=np.float32)
+    def _read_timeseries(self, start, stop, step, atom_numbers):
+        """Read the coordinates of the atoms `atom_numbers` in the frames
+        ``range(start, stop, step)`` into a new array in 'fac' order.
+
+        The default iterates through the trajectory; readers that can gather
+        the coordinates directly override this method.
+        """
+        nframes = len(range(start, stop, step))
+        coordinates = np.empty((nframes, len(atom_numbers), 3),
+                               dtype=np.float32)
         for i, ts in enumerate(self[start:stop:step]):
             coordinates[i, :] = ts.positions[atom_numbers]
+        return coordinates
 
-        # switch axes around
+    @staticmethod
+    def _timeseries_order(coordinates, order):
+        """Switch the axes of the 'fac' ordered `coordinates` to `order`."""
         default_order = 'fac'
         if order != default_order:
             try:
@@ -23,6 +23,7 @@
 #
 
 import cython
+from cython cimport floating
 import numpy as np
 cimport numpy as cnp
 from libc.math cimport sqrt, fabs
@@ -38,7 +39,8 @@ from cython.operator cimport dereference as deref
 cnp.import_array()
 
 __all__ = ['unique_int_1d', 'make_whole', 'find_fragments',
-           '_sarrus_det_single', '_sarrus_det_multiple']
+           '_sarrus_det_single', '_sarrus_det_multiple',
+           '_parse_fixed_width_floats', '_scale_float32']
 
 cdef extern from "calc_distances.h":
     ctypedef float coordinate[3]
@@ -516,3 +518,185 @@ def find_fragments(atoms, bondlist):
         frags.append(np.asarray(this_frag))
 
     return frags
+
+
+cdef inline bint _parse_decimal(const unsigned char *field, int width,
+                                float *result) noexcept nogil:
+    """Parse a right-justified plain decimal number such as ``' -12.345'``.
+
+    Returns ``False`` if the field is not of the form
+    ``[blanks][sign]digits[.digits][blanks]``.
+    """
+    cdef int j = 0
+    cdef int ndigits = 0
+    cdef int decimals = 0
+    cdef bint negative = False
+    cdef bint seen_point = False
+    cdef cnp.int64_t mantissa = 0
+    cdef double value
+    cdef double scale = 1.0
+    cdef unsigned char c
+
+    while j < width and field[j] == b' ':
+        j += 1
+    if j < width and (field[j] == b'-' or field[j] == b'+'):
+        negative = field[j] == b'-'
+        j += 1
+    while j < width:
+        c = field[j]
+        if b'0' <= c <= b'9':
+            mantissa = 10 * mantissa + (c - c'0')
+            ndigits += 1
+            if seen_point:
+                decimals += 1
+        elif c == b'.' and not seen_point:
+            seen_point = True
+        else:
+            break
+        j += 1
+    while j < width and field[j] == b' ':
+        j += 1
+    # mantissa and power of ten must be exact doubles for correct rounding
+    if j != width or ndigits == 0 or ndigits > 15:
+        return False
+
+    for j in range(decimals):
+        scale *= 10.0
+    value = mantissa / scale
+    if negative:
+        value = -value
+    result[0] = <float>value
+    return True
+
+
+cdef bint _parse_float(const unsigned char *field, int width,
+                       float *result) noexcept:
+    """Parse any field that :func:`float` accepts, such as ``'  1.0e-3'``."""
+    try:
+        result[0] = float((<const char *>field)[:width])
+    except ValueError:
+        return False
+    return True
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _parse_fixed_width_floats(const unsigned char[::1] buf, float[::1] out,
+                              int width, int per_line, Py_ssize_t start=0):
+    """Parse floats from fixed-width columns of a text buffer.
+
+    Fills `out` with ``len(out)`` fields of `width` characters each, read
+    from `buf` beginning at position `start`, with at most `per_line` fields
+    on each line (as written with a FORTRAN ``FORMAT(10F8.3)`` statement).
+    Any characters between the last field of a line and the newline are
+    ignored, so that both ``\\n`` and ``\\r\\n`` line endings are supported.
+
+    Plain decimal numbers such as ``'  -1.234'`` are converted without
+    calling into Python (the mantissa and the power of ten are both exact
+    doubles, so that a single division gives the correctly rounded result).
+    Other fields, e.g. in exponent notation, fall back to :func:`float`.
+
+    Parameters
+    ----------
+    buf : bytes
+        ASCII buffer holding the lines to be parsed
+    out : numpy.ndarray
+        1D array of dtype ``numpy.float32`` that receives the values
+    width : int
+        width of a field in characters
+    per_line : int
+        maximum number of fields on a line
+    start : int (optional)
+        position in `buf` of the first field
+
+    Returns
+    -------
+    int
+        position in `buf` just after the line holding the last field
+
+    Raises
+    ------
+    ValueError
+        if a field cannot be converted to float or `buf` is too short
+
+
+    .. versionadded:: 2.8.0
+    """
+    cdef Py_ssize_t n = out.shape[0]
+    cdef Py_ssize_t size = buf.shape[0]
+    cdef Py_ssize_t pos = start
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t line_end
+    cdef bint ok = True
+    cdef bint truncated = False
+
+    with nogil:
+        while i < n:
+            # all lines hold per_line fields except possibly the last one, so
+            # the buffer size is checked once per line instead of per field
+            line_end = i + per_line if n - i > per_line else n
+            if pos + (line_end - i) * width > size:
+                ok = False
+                truncated = True
+                break
+            while i < line_end:
+                if not _parse_decimal(&buf[pos], width, &out[i]):
+                    with gil:
+                        ok = _parse_float(&buf[pos], width, &out[i])
+                    if not ok:
+                        break
+                pos += width
+                i += 1
+            if not ok:
+                break
+            # skip to the start of the next line
+            while pos < size and buf[pos] != b'\n':
+                pos += 1
+            pos += 1
+    if not ok:
+        if truncated:
+            raise ValueError("Buffer ended after {0} of {1} fields".format(
+                i, n))
+        raise ValueError("Could not convert field {0!r} to float".format(
+            bytes(buf[pos:pos + width]).decode('ascii', 'replace')))
+    return min(pos, size)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _scale_float32(const floating[:, :] src, double factor,
+                   float[:, ::1] out):
+    """Multiply `src` by `factor` and store the result in `out`.
+
+    The product is formed in double precision and rounded once to single
+    precision, in a single pass over the data without temporary arrays.
+
+    Parameters
+    ----------
+    src : numpy.ndarray
+        2D array of dtype ``numpy.float32`` or ``numpy.float64``, which may be
+        a strided view
+    factor : float
+        factor that `src` is multiplied with
+    out : numpy.ndarray
+        C-contiguous array of dtype ``numpy.float32`` and the same shape as
+        `src` that receives the result
+
+    Raises
+    ------
+    ValueError
+        if `src` and `out` differ in shape
+
+
+    .. versionadded:: 2.8.0
+    """
+    cdef Py_ssize_t i, j
+
+    if src.shape[0] != out.shape[0] or src.shape[1] != out.shape[1]:
+        raise ValueError("src of shape ({0}, {1}) does not match out of shape "
+                         "({2}, {3})".format(src.shape[0], src.shape[1],
+                                             out.shape[0], out.shape[1]))
+    with nogil:
+        for i in range(src.shape[0]):
+            for j in range(src.shape[1]):
+                out[i, j] = <float>(src[i, j] * factor)
@@ -31,7 +31,7 @@ from numpy.testing import (
     assert_equal,
     assert_almost_equal
 )
-from MDAnalysis.coordinates.TRJ import NCDFReader, NCDFWriter
+from MDAnalysis.coordinates.TRJ import NCDFReader, NCDFWriter, NCDFPicklable
 
 from MDAnalysisTests.datafiles import (PFncdf_Top, PFncdf_Trj,
                                        GRO, TRR, XYZ_mini,
@@ -91,6 +91,24 @@ class _NCDFReaderTest(_TRJReaderTest):
         # default is None
         assert universe.trajectory._mmap == None
 
+    @pytest.mark.parametrize('order', ('fac', 'afc', 'cfa'))
+    @pytest.mark.parametrize('start,stop,step', ((None, None, None),
+                                                 (1, -1, 2)))
+    def test_timeseries(self, universe, order, start, stop, step):
+        trj = universe.trajectory
+        atoms = universe.atoms[::3]
+        timeseries = trj.timeseries(atomgroup=atoms, start=start, stop=stop,
+                                    step=step, order=order)
+        # reference from iterating through the trajectory
+        ref = np.array([ts.positions[atoms.indices]
+                        for ts in trj[start:stop:step]])
+        ref = ref.transpose(['fac'.index(key) for key in order])
+        assert_equal(timeseries, ref)
+
+    def test_timeseries_reversed(self, universe):
+        trj = universe.trajectory
+        assert_equal(trj.timeseries(step=-1), trj.timeseries()[::-1])
+
 
 # Ugly way to create the tests for mmap
 
@@ -299,6 +317,28 @@ class TestNCDFReader3(object):
         universe.trajectory[index]
         assert_almost_equal(self.box_refs[expected], universe.dimensions)
 
+    @pytest.mark.parametrize('prefetch', (2, 3, 10))
+    def test_prefetch(self, prefetch):
+        u = mda.Universe(PRM_NCBOX, TRJ_NCBOX, prefetch=prefetch)
+        universe = mda.Universe(PRM_NCBOX, TRJ_NCBOX, prefetch=1)
+        assert u.trajectory._prefetch == prefetch
+        for ts, ref in zip(u.trajectory, universe.trajectory):
+            assert_equal(ts.positions, ref.positions)
+            assert_equal(ts.velocities, ref.velocities)
+            assert_equal(ts.forces, ref.forces)
+            assert_equal(ts.dimensions, ref.dimensions)
+            assert ts.time == ref.time
+        # random access after the read-ahead
+        assert_equal(u.trajectory[1].positions,
+                     universe.trajectory[1].positions)
+
+    @pytest.mark.parametrize('mmap', (True, False))
+    def test_release_pages(self, mmap):
+        with NCDFPicklable(TRJ_NCBOX, mmap=mmap) as f:
+            ref = f.variables['coordinates'][:].copy()
+            f._release_pages()
+            assert_equal(f.variables['coordinates'][:], ref)
+
 
 class TestNCDFReader4(object):
     """NCDF Trajectory exported by cpptaj, without `time` variable."""
@@ -495,6 +535,8 @@ class TestScaleFactorImplementation(_NCDFGenerator):
             u = mda.Universe(params['filename'])
             for ts in u.trajectory:
                 assert_almost_equal(ts.positions[0], expected, self.prec)
+            assert_almost_equal(u.trajectory.timeseries()[:, 0],
+                                [expected, expected], self.prec)
 
     def test_scale_factor_velocities(self, tmpdir):
         mutation = {'scale_factor': 'velocities', 'scale_factor_value': 3.0}
@@ -530,6 +572,16 @@ class TestScaleFactorImplementation(_NCDFGenerator):
             for ts in u.trajectory:
                 assert_almost_equal(ts.dimensions, expected, self.prec)
 
+    def test_scale_factor_zero_box(self, tmpdir):
+        # a box without lengths is not a box, even with convert_units
+        mutation = {'scale_factor': 'cell_lengths', 'scale_factor_value': 0.0}
+        params = self.gen_params(keypair=mutation, restart=False)
+        with tmpdir.as_cwd():
+            self.create_ncdf(params)
+            u = mda.Universe(params['filename'], convert_units=True)
+            for ts in u.trajectory:
+                assert ts.dimensions is None
+
     def test_scale_factor_not_float(self, tmpdir):
         mutation = {'scale_factor': 'coordinates',
                     'scale_factor_value': 'parsnips'}
@@ -592,7 +644,8 @@ class TestNCDFReaderExceptionsWarnings(_NCDFGenerator):
     def test_verify_units_errors(self, evaluate, expected):
         """Directly tests expected failures of _verify_units"""
         with pytest.raises(NotImplementedError):
-            NCDFReader._verify_units(evaluate.encode('utf-8'), expected)
+            NCDFReader._verify_units(evaluate.encode('utf-8'),
+                                     expected.encode('utf-8'))
 
     def test_ioerror(self, tmpdir):
         params = self.gen_params(restart=False)
@@ -712,6 +765,61 @@ class _NCDFWriterTest(object):
         finally:
             sys.modules['MDAnalysis.coordinates.TRJ'].netCDF4 = loaded_netCDF4
 
+    @pytest.mark.parametrize('buffer_frames', [1, 3])
+    def test_write_buffer_frames(self, universe, outfile, buffer_frames):
+        t = universe.trajectory
+        with mda.Writer(outfile, t.n_atoms, format="ncdf",
+                        buffer_frames=buffer_frames) as W:
+            self._copy_traj(W, universe)
+            assert W.buffer_frames == buffer_frames
+        self._check_new_traj(universe, outfile)
+
+    @pytest.mark.parametrize('buffer_frames', [1, 3])
+    def test_write_async_io(self, universe, outfile, buffer_frames):
+        pytest.importorskip("netCDF4")
+        t = universe.trajectory
+        with mda.Writer(outfile, t.n_atoms, format="ncdf", async_io=True,
+                        buffer_frames=buffer_frames) as W:
+            self._copy_traj(W, universe)
+        assert W._executor is None
+        self._check_new_traj(universe, outfile)
+
+    def test_write_frames(self, universe, outfile):
+        t = universe.trajectory
+        # the timestep arrays are reused for every frame
+        positions = np.array([ts.positions.copy() for ts in t])
+        times = np.array([ts.time for ts in t])
+        boxes = (None if t.ts.dimensions is None
+                 else np.array([ts.dimensions.copy() for ts in t]))
+        with NCDFWriter(outfile, t.n_atoms) as W:
+            # mix frame by frame and bulk writing
+            t[0]
+            W.write(universe)
+            W.write_frames(positions[1:], times[1:],
+                           None if boxes is None else boxes[1:])
+        self._check_new_traj(universe, outfile)
+
+    def test_write_frames_VE(self, universe, outfile):
+        with NCDFWriter(outfile, universe.atoms.n_atoms) as W:
+            with pytest.raises(ValueError, match="coordinates of shape"):
+                W.write_frames(np.zeros((2, 3, 3)), np.zeros(2))
+
+    @pytest.mark.parametrize('name', ('velocities', 'forces'))
+    def test_write_frames_not_written(self, universe, outfile, name):
+        n_atoms = universe.atoms.n_atoms
+        with NCDFWriter(outfile, n_atoms) as W:
+            with pytest.raises(ValueError, match="given but not written"):
+                W.write_frames(np.zeros((1, n_atoms, 3)), np.zeros(1),
+                               **{name: np.ones((1, n_atoms, 3))})
+
+    def test_write_frames_boxes_not_periodic(self, universe, outfile):
+        n_atoms = universe.atoms.n_atoms
+        with NCDFWriter(outfile, n_atoms) as W:
+            W.write_frames(np.zeros((1, n_atoms, 3)), np.zeros(1))
+            with pytest.raises(ValueError, match="not periodic"):
+                W.write_frames(np.zeros((1, n_atoms, 3)), np.zeros(1),
+                               np.zeros((1, 6)))
+
     def test_OtherWriter(self, universe, outfile_extensions):
         t = universe.trajectory
         with t.OtherWriter(outfile_extensions) as W:
@@ -1072,6 +1180,55 @@ class TestNCDFWriterUnits(object):
             assert_equal(unit, expected)
 
 
+class TestNCDFWriterStorage(object):
+    """Tests for the storage layout options of the writer"""
+    @pytest.fixture()
+    def outfile(self, tmpdir):
+        return str(tmpdir) + 'ncdf-writer-storage.ncdf'
+
+    @pytest.mark.parametrize('buffer_frames', [1, 2, None])
+    def test_constant_box(self, outfile, buffer_frames):
+        u = mda.Universe(PRM_NCBOX, TRJ_NCBOX)
+        with NCDFWriter(outfile, u.atoms.n_atoms, constant_box=True,
+                        buffer_frames=buffer_frames) as W:
+            for ts in u.trajectory:
+                W.write(u.atoms)
+
+        uw = mda.Universe(PRM_NCBOX, outfile)
+        u.trajectory[0]
+        assert len(uw.trajectory) == len(u.trajectory)
+        for ts in uw.trajectory:
+            assert_almost_equal(ts.dimensions, u.dimensions, 4)
+
+    def test_write_netcdf4_classic(self, outfile):
+        netCDF4 = pytest.importorskip("netCDF4")
+        u = mda.Universe(PRM_NCBOX, TRJ_NCBOX)
+        with NCDFWriter(outfile, u.atoms.n_atoms, nc_format='NETCDF4_CLASSIC',
+                        compression='zlib', frames_per_chunk=2) as W:
+            for ts in u.trajectory:
+                W.write(u.atoms)
+
+        with netCDF4.Dataset(outfile) as ncfile:
+            assert ncfile.data_model == 'NETCDF4_CLASSIC'
+            coords = ncfile.variables['coordinates']
+            assert coords.chunking() == [2, u.atoms.n_atoms, 3]
+            assert coords.filters()['zlib']
+            assert coords.filters()['shuffle']
+            assert not ncfile.variables['time'].filters()['zlib']
+            for ts in u.trajectory:
+                assert_almost_equal(coords[ts.frame], u.atoms.positions, 4)
+
+    @pytest.mark.parametrize('n_atoms, expected', [
+        (10, 1024), (100000, 17), (10000000, 1)])
+    def test_frames_per_chunk_default(self, outfile, n_atoms, expected):
+        assert NCDFWriter(outfile, n_atoms).frames_per_chunk == expected
+
+    @pytest.mark.parametrize('n_atoms, expected', [
+        (10, 32 * 1024**2), (10000000, 480000000)])
+    def test_chunk_cache_bytes_default(self, outfile, n_atoms, expected):
+        assert NCDFWriter(outfile, n_atoms).chunk_cache_bytes == expected
+
+
 class TestNCDFWriterErrorsWarnings(object):
     @pytest.fixture()
     def outfile(self, tmpdir):
@@ -1081,6 +1238,42 @@ class TestNCDFWriterErrorsWarnings(object):
         with pytest.raises(ValueError):
             NCDFWriter(outfile, 0)
 
+    def test_bad_nc_format(self, outfile):
+        errmsg = "nc_format NETCDF4 is not 'NETCDF3_64BIT' or"
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, nc_format='NETCDF4')
+
+    def test_nc_format_without_netCDF4(self, outfile, monkeypatch):
+        monkeypatch.setattr(sys.modules['MDAnalysis.coordinates.TRJ'],
+                            'netCDF4', None)
+        errmsg = "nc_format NETCDF4_CLASSIC requires the netCDF4 module"
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, nc_format='NETCDF4_CLASSIC')
+
+    def test_bad_compression(self, outfile):
+        errmsg = "compression lzf is not 'zlib' or None"
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, compression='lzf')
+
+    @pytest.mark.parametrize('buffer_frames', (0, -1, 2.5))
+    def test_bad_buffer_frames(self, outfile, buffer_frames):
+        errmsg = f"buffer_frames {buffer_frames} is not None or an int >= 1"
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, buffer_frames=buffer_frames)
+
+    @pytest.mark.parametrize('frames_per_chunk', (0, -4))
+    def test_bad_frames_per_chunk(self, outfile, frames_per_chunk):
+        errmsg = (f"frames_per_chunk {frames_per_chunk} is not None or an "
+                  "int >= 1")
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, frames_per_chunk=frames_per_chunk)
+
+    @pytest.mark.parametrize('complevel', (0, 42))
+    def test_bad_complevel(self, outfile, complevel):
+        errmsg = f"complevel {complevel} is not an int between 1 and 9"
+        with pytest.raises(ValueError, match=errmsg):
+            NCDFWriter(outfile, 10, compression='zlib', complevel=complevel)
+
     def test_wrong_n_atoms(self, outfile):
         with NCDFWriter(outfile, 100) as w:
             u = make_Universe(trajectory=True)
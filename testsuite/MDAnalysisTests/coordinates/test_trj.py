@@ -20,6 +20,8 @@
 # MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
+import io
+
 import numpy as np
 import pytest
 
@@ -29,6 +31,7 @@ from numpy.testing import (
 )
 
 import MDAnalysis as mda
+from MDAnalysis.lib.util import NamedStream, openany
 from MDAnalysisTests.coordinates.reference import RefACHE, RefCappedAla
 from MDAnalysisTests.datafiles import (PRM, TRJ, TRJ_bz2, PRMpbc, TRJpbc_bz2)
 
@@ -120,6 +123,33 @@ class TestTRJReader(_TRJReaderTest, RefACHE):
         u.trajectory[2]
         assert u.trajectory.ts.frame == 2
 
+    def test_frame_offsets(self, universe):
+        trj = universe.trajectory
+        lpf = trj.lines_per_frame + trj.periodic
+        assert trj.n_frames == self.ref_n_frames
+        assert_equal(trj._offsets, trj._read_frame_offsets(lpf))
+
+    def test_scan_frame_offsets_blocks(self, universe):
+        trj = universe.trajectory
+        lpf = trj.lines_per_frame + trj.periodic
+        with openany(self.trajectory_file, 'rb') as f:
+            data = np.frombuffer(f.read(), dtype=np.uint8)
+        assert_equal(trj._scan_frame_offsets(data, lpf, chunk=1000),
+                     trj._read_frame_offsets(lpf))
+
+    def test_trailing_whitespace(self, universe, tmpdir):
+        # frames are not equally wide: offsets must come from a full scan
+        outfile = str(tmpdir.join('trailing.mdcrd'))
+        with openany(self.trajectory_file, 'rb') as inf:
+            with open(outfile, 'wb') as outf:
+                outf.write(inf.read() + b'    \n')
+        u = mda.Universe(self.topology_file, outfile)
+        assert u.trajectory.n_frames == self.ref_n_frames
+        assert len([ts for ts in u.trajectory]) == self.ref_n_frames
+        universe.trajectory[-1]
+        u.trajectory[-1]
+        assert_equal(u.atoms.positions, universe.atoms.positions)
+
 
 class TestBzippedTRJReader(TestTRJReader):
     topology_file = PRM
@@ -136,3 +166,13 @@ class TestBzippedTRJReaderPBC(_TRJReaderTest, RefCappedAla):
 def test_trj_no_natoms():
     with pytest.raises(ValueError):
         mda.coordinates.TRJ.TRJReader('somefile.txt')
+
+
+def test_trj_namedstream():
+    with open(TRJ) as f:
+        stream = NamedStream(io.StringIO(f.read()), 'ache.mdcrd')
+    u = mda.Universe(PRM, stream)
+    ref = mda.Universe(PRM, TRJ)
+    assert u.trajectory.n_frames == ref.trajectory.n_frames
+    for ts, ref_ts in zip(u.trajectory, ref.trajectory):
+        assert_equal(ts.positions, ref_ts.positions)
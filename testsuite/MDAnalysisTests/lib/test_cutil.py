@@ -25,7 +25,8 @@ import numpy as np
 from numpy.testing import assert_equal
 
 from MDAnalysis.lib._cutil import (
-    unique_int_1d, find_fragments, _in2d,
+    unique_int_1d, find_fragments, _in2d, _parse_fixed_width_floats,
+    _scale_float32,
 )
 
 
@@ -85,3 +86,62 @@ def test_in2d_VE(arr1, arr2):
     with pytest.raises(ValueError,
                        match=r'Both arrays must be \(n, 2\) arrays'):
         _in2d(arr1, arr2)
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n'])
+def test_parse_fixed_width_floats(newline):
+    # the last line of a block may hold fewer fields
+    buf = newline.join([b'  32.555  -4.652   0.213',
+                        b'-100.138    .217']) + newline + b'  99.999'
+    out = np.zeros(5, dtype=np.float32)
+
+    pos = _parse_fixed_width_floats(buf, out, 8, 3)
+
+    assert_equal(out, np.array([32.555, -4.652, 0.213, -100.138, 0.217],
+                               dtype=np.float32))
+    assert buf[pos:] == b'  99.999'
+
+
+def test_parse_fixed_width_floats_fallback():
+    # fields that are not plain decimals are handed to float()
+    buf = b' 1.25e-3     nan  -1.0E2'
+    out = np.zeros(3, dtype=np.float32)
+
+    _parse_fixed_width_floats(buf, out, 8, 10)
+
+    assert_equal(out, np.array([1.25e-3, np.nan, -100.], dtype=np.float32))
+
+
+@pytest.mark.parametrize('buf', [
+    b'   1.000    *****',  # overflow marker
+    b'   1.000        ',  # blank field
+    b'   1.000   2.0',  # buffer too short
+])
+def test_parse_fixed_width_floats_VE(buf):
+    with pytest.raises(ValueError):
+        _parse_fixed_width_floats(buf, np.zeros(2, dtype=np.float32), 8, 10)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_scale_float32(dtype):
+    src = np.arange(12, dtype=dtype).reshape(4, 3) + 0.1
+    out = np.empty((4, 3), dtype=np.float32)
+
+    _scale_float32(src, 0.5, out)
+
+    assert_equal(out, (src.astype(np.float64) * 0.5).astype(np.float32))
+
+
+def test_scale_float32_strided():
+    src = np.arange(24, dtype=np.float32).reshape(3, 8).T[:, :3]
+    out = np.empty((8, 3), dtype=np.float32)
+
+    _scale_float32(src, 2., out)
+
+    assert_equal(out, 2 * src)
+
+
+def test_scale_float32_VE():
+    with pytest.raises(ValueError):
+        _scale_float32(np.zeros((4, 3), dtype=np.float32), 2.,
+                       np.empty((3, 3), dtype=np.float32))